@@ -0,0 +1,115 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Checks (or prints) the lazy-registration manifest of the PostProcessors factory.
+
+  Models/PostProcessors/Factory.py registers the post-processor types from a static
+  manifest instead of importing every submodule and reflecting over subclasses, so
+  the manifest must be kept in sync with the classes actually defined in the
+  package. This script discovers PostProcessorInterface subclasses by parsing the
+  sources (no imports, so no heavy dependencies needed) and compares the result
+  with the manifest. Run with --print to emit the expected manifest literal.
+"""
+import os
+import ast
+import sys
+import argparse
+
+scriptDir = os.path.dirname(os.path.abspath(__file__))
+ppDir = os.path.join(scriptDir, '..', 'ravenframework', 'Models', 'PostProcessors')
+# class names that are Qt-guarded variants registered via preferredClassName, not manifest entries
+qtVariants = {'QTopologicalDecomposition', 'QDataMining'}
+
+def collectClasses(directory, package=''):
+  """
+    Parses every module under "directory" and collects top-level class definitions.
+    @ In, directory, str, absolute path of the package directory to scan
+    @ In, package, str, optional, dotted prefix for submodule names (used for subpackages)
+    @ Out, classes, dict, map of class name -> (submodule name, list of base class names)
+  """
+  classes = {}
+  for entry in sorted(os.listdir(directory)):
+    fullPath = os.path.join(directory, entry)
+    if os.path.isdir(fullPath) and os.path.isfile(os.path.join(fullPath, '__init__.py')):
+      classes.update(collectClasses(fullPath, package=f'{package}{entry}.'))
+    elif entry.endswith('.py') and entry != '__init__.py':
+      modName = package + entry[:-3]
+      with open(fullPath, 'r') as sourceFile:
+        tree = ast.parse(sourceFile.read(), filename=fullPath)
+      for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+          bases = [base.id if isinstance(base, ast.Name) else getattr(base, 'attr', None)
+                   for base in node.bases]
+          classes[node.name] = (modName, bases)
+  return classes
+
+def expectedManifest():
+  """
+    Builds the expected manifest (submodule -> class names) from the parsed sources.
+    @ In, None
+    @ Out, manifest, dict, map of submodule name -> list of PostProcessorInterface subclass names
+  """
+  classes = collectClasses(ppDir)
+  # close over inheritance starting from the interface itself
+  subclasses = {'PostProcessorInterface'}
+  changed = True
+  while changed:
+    changed = False
+    for name, (_, bases) in classes.items():
+      if name not in subclasses and any(base in subclasses for base in bases):
+        subclasses.add(name)
+        changed = True
+  subclasses.discard('PostProcessorInterface')
+  subclasses -= qtVariants
+  manifest = {}
+  for name in subclasses:
+    manifest.setdefault(classes[name][0], []).append(name)
+  return {submod: sorted(attrs) for submod, attrs in sorted(manifest.items())}
+
+def main():
+  """
+    Compares the Factory manifest against the parsed sources and reports differences.
+    @ In, None
+    @ Out, main, int, 0 if the manifest is in sync, 1 otherwise
+  """
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--print', action='store_true', dest='printManifest',
+                      help='print the expected manifest literal instead of checking')
+  args = parser.parse_args()
+  expected = expectedManifest()
+  if args.printManifest:
+    print('_submoduleAttributes = {')
+    for submod, attrs in expected.items():
+      print(f"    '{submod}': {attrs!r},")
+    print('}')
+    return 0
+  sys.path.insert(0, os.path.join(scriptDir, '..'))
+  from ravenframework.Models.PostProcessors import Factory
+  actual = {submod: sorted(attrs) for submod, attrs in Factory._submoduleAttributes.items()}
+  okay = True
+  for submod, attrs in expected.items():
+    missing = set(attrs) - set(actual.get(submod, []))
+    if missing:
+      okay = False
+      print(f'MISSING from manifest: {submod} -> {sorted(missing)}')
+  for submod, attrs in actual.items():
+    stale = set(attrs) - set(expected.get(submod, []))
+    if stale:
+      okay = False
+      print(f'STALE in manifest: {submod} -> {sorted(stale)}')
+  print('Manifest is in sync.' if okay else 'Manifest is OUT OF SYNC; update Factory.py (see --print).')
+  return 0 if okay else 1
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -17,11 +17,20 @@ Created March 15, 2020
 @author: talbpaul
 """
 
+import sys
+import importlib
+import weakref
+from collections import namedtuple
+
 from .BaseClasses import MessageUser
 from .BaseClasses import InputDataUser
 from . import PluginManager
 from .utils import utils
 
+# lightweight per-type record for deferred registrations; a namedtuple keeps the
+# per-entry footprint at plain-tuple size while naming the fields
+LazyEntry = namedtuple('LazyEntry', ['moduleName', 'className', 'preferredClassName'])
+
 class EntityFactory(MessageUser):
   """
     Provides structure for entity factory
@@ -40,6 +49,8 @@ class EntityFactory(MessageUser):
     self.needsRunInfo = needsRunInfo                 # whether entity needs run info
     self.returnInputParameter = returnInputParameter # use xml or inputParams
     self._registeredTypes = {}                       # registered types for this entity
+    self._lazyTypes = {}                             # types registered by name only, resolved (imported) on first request
+    self._instanceCache = weakref.WeakValueDictionary() # shared instances handed out by returnSharedInstance
     self._pluginFactory = PluginManager              # plugin factory, if any; provided by Simulation
 
   def registerType(self, name, obj):
@@ -53,7 +64,34 @@ class EntityFactory(MessageUser):
     # if name in self._registeredTypes:
     #   raise RuntimeError(f'Duplicate entries in "{self.name}" Factory type "{name}": '+
     #                      f'{self._registeredTypes[name]}, {obj}')
-    self._registeredTypes[name] = obj
+    # interned keys let hot returnClass lookups hit the dict's pointer-identity fast path
+    self._registeredTypes[sys.intern(name)] = obj
+
+  def registerLazyType(self, name, moduleName, className, preferredClassName=None):
+    """
+      Registers a type for this entity without importing the module that defines it.
+      The module is only imported (and the class looked up) when "name" is first
+      requested through returnClass/returnInstance, keeping heavy dependencies off
+      the import path of the registering module.
+      @ In, name, str, name by which entity should be known
+      @ In, moduleName, str, absolute module path defining the class (e.g. ravenframework.Models.PostProcessors.BasicStatistics)
+      @ In, className, str, name of the class within "moduleName"
+      @ In, preferredClassName, str, optional, name of a class to use instead of "className" if
+        the module defines it (e.g. a variant guarded by an optional dependency)
+      @ Out, None
+    """
+    self._lazyTypes[sys.intern(name)] = LazyEntry(moduleName, className, preferredClassName)
+
+  def registerMany(self, entries):
+    """
+      Registers several lazy types in one call, writing the records directly from an
+      explicit manifest with no subclass reflection involved.
+      @ In, entries, iterable, iterable of (name, moduleName, className, preferredClassName)
+        tuples as accepted by registerLazyType (preferredClassName may be None)
+      @ Out, None
+    """
+    for entry in entries:
+      self.registerLazyType(*entry)
 
   def registerAllSubtypes(self, baseType, alias=None):
     """
@@ -64,7 +102,15 @@ class EntityFactory(MessageUser):
     """
     if alias is None:
       alias = {}
-    for obj in utils.getAllSubclasses(baseType):
+    # base types that record their subclasses at class-definition time (via an
+    # __init_subclass__ registry) skip the recursive reflection walk entirely;
+    # check the class's own namespace so a subtree request on a subclass of the
+    # declaring type still walks only that subtree instead of the whole registry
+    if '_registeredSubclasses' in vars(baseType):
+      subclasses = baseType._registeredSubclasses.values()
+    else:
+      subclasses = utils.getAllSubclasses(baseType)
+    for obj in subclasses:
       name = alias.get(obj.__name__, obj.__name__)
       self.registerType(name, obj)
 
@@ -75,6 +121,7 @@ class EntityFactory(MessageUser):
       @ Out, None
     """
     self._registeredTypes.pop(name, None)
+    self._lazyTypes.pop(name, None)
 
   def knownTypes(self):
     """
@@ -82,7 +129,9 @@ class EntityFactory(MessageUser):
       @ Out, __knownTypes, list, list of known types
     """
     # NOTE: plugins might not be listed if they haven't been loaded yet!
-    return self._registeredTypes.keys()
+    known = list(self._registeredTypes)
+    known.extend(name for name in self._lazyTypes if name not in self._registeredTypes)
+    return known
 
   def returnClass(self, Type):
     """
@@ -95,6 +144,17 @@ class EntityFactory(MessageUser):
     try:
       return self._registeredTypes[Type]
     except KeyError:
+      # is this a lazily-registered type, not yet imported?
+      lazy = self._lazyTypes.get(Type)
+      if lazy is not None:
+        module = importlib.import_module(lazy.moduleName)
+        if lazy.preferredClassName is not None and hasattr(module, lazy.preferredClassName):
+          cls = getattr(module, lazy.preferredClassName)
+        else:
+          cls = getattr(module, lazy.className)
+        # memoize the resolved class so later requests are a single dict hit
+        self._registeredTypes[Type] = cls
+        return cls
       # is this a request from an unloaded plugin?
       obj = self._checkInUnloadedPlugin(Type)
       if obj is None:
@@ -116,6 +176,29 @@ class EntityFactory(MessageUser):
     instance = cls(**kwargs)
     return instance
 
+  def returnSharedInstance(self, Type, **kwargs):
+    """
+      Returns an instance for the requested type, reusing a previously built one if an
+      identical request was already served and the instance is still alive. Intended for
+      entities that are configured identically many times (e.g. the same post-processor
+      spec requested once per branching sample); callers that mutate per-run state on
+      their entity should use returnInstance instead. Instances are held weakly, so
+      the cache never extends an object's lifetime.
+      @ In, Type, string, requested object
+      @ In, kwargs, dict, additional keyword arguments to constructor (must be hashable)
+      @ Out, returnSharedInstance, instance, shared instance of the object
+    """
+    key = (Type, tuple(sorted(kwargs.items())))
+    try:
+      instance = self._instanceCache.get(key)
+    except TypeError:
+      # unhashable constructor arguments; fall back to a fresh instance
+      return self.returnInstance(Type, **kwargs)
+    if instance is None:
+      instance = self.returnInstance(Type, **kwargs)
+      self._instanceCache[key] = instance
+    return instance
+
   def collectInputSpecs(self, base):
     """
       Extends "base" to include all specs for all objects known by this factory as children of "base"
@@ -136,7 +219,7 @@ class EntityFactory(MessageUser):
       @ Out, name, str, identifying name of entity
       @ Out, entity, instance, object from factory
     """
-    kind = xml.tag
+    kind = sys.intern(xml.tag)
     name = xml.attrib['name']
     entity = self.returnInstance(kind)
     return kind, name, entity
@@ -14,53 +14,109 @@
 """
 Factory for generating the instances of the  Models Module
 """
+import types
+import itertools
+import importlib
 
-from ...EntityFactoryBase import EntityFactory
-from .PostProcessorInterface import PostProcessorInterface
-from .PostProcessorReadyInterface import PostProcessorReadyInterface
-from .BasicStatistics import BasicStatistics
-from .LimitSurface import LimitSurface
-from .Metric import Metric
-from .DataMining import DataMining
-from .SafestPoint import SafestPoint
-from .ValueDuration import ValueDuration
-from .SampleSelector import SampleSelector
-from .ImportanceRank import ImportanceRank
-from .CrossValidation import CrossValidation
-from .LimitSurfaceIntegral import LimitSurfaceIntegral
-from .FastFourierTransform import FastFourierTransform
-from .ExternalPostProcessor import ExternalPostProcessor
-from .TopologicalDecomposition import TopologicalDecomposition
-from .ComparisonStatisticsModule import ComparisonStatistics
-from .RealizationAverager import RealizationAverager
-from .ParetoFrontierPostProcessor import ParetoFrontier
-from .EconomicRatio import EconomicRatio
-from .ValidationBase import ValidationBase
-from .Validations import Probabilistic
-from .Validations import PPDSS
-from .Validations import PhysicsGuidedCoverageMapping
-from .TSACharacterizer import TSACharacterizer
+# Map of submodule name -> post-processor class names defined in it. The submodules
+# are NOT imported when this module loads; they are imported on first attribute
+# access (PEP 562 module __getattr__) or on the first factory request of the
+# corresponding type, so the heavy third-party dependencies some of them carry
+# (scipy, sklearn, PySide) are only paid for when a post-processor is actually
+# requested.
+_submoduleAttributes = {
+    'PostProcessorReadyInterface': ['PostProcessorReadyInterface'],
+    'BasicStatistics': ['BasicStatistics'],
+    'LimitSurface': ['LimitSurface'],
+    'Metric': ['Metric'],
+    'DataMining': ['DataMining'],
+    'SafestPoint': ['SafestPoint'],
+    'ValueDuration': ['ValueDuration'],
+    'SampleSelector': ['SampleSelector'],
+    'ImportanceRank': ['ImportanceRank'],
+    'CrossValidation': ['CrossValidation'],
+    'LimitSurfaceIntegral': ['LimitSurfaceIntegral'],
+    'FastFourierTransform': ['FastFourierTransform'],
+    'ExternalPostProcessor': ['ExternalPostProcessor'],
+    'TopologicalDecomposition': ['TopologicalDecomposition'],
+    'ComparisonStatisticsModule': ['ComparisonStatistics'],
+    'RealizationAverager': ['RealizationAverager'],
+    'ParetoFrontierPostProcessor': ['ParetoFrontier'],
+    'EconomicRatio': ['EconomicRatio'],
+    'ValidationBase': ['ValidationBase'],
+    'Validations.Probabilistic': ['Probabilistic'],
+    'Validations.PPDSS': ['PPDSS'],
+    'Validations.PhysicsGuidedCoverageMapping': ['PhysicsGuidedCoverageMapping'],
+    'TSACharacterizer': ['TSACharacterizer'],
+    ### PostProcessorFunctions (orig: InterfacedPostProcessor)
+    'HistorySetDelay': ['HistorySetDelay'],
+    'HS2PS': ['HS2PS'],
+    'HStoPSOperator': ['HStoPSOperator'],
+    'HistorySetSampling': ['HistorySetSampling'],
+    'HistorySetSnapShot': ['HistorySetSnapShot'],
+    'HistorySetSync': ['HistorySetSync'],
+    'TypicalHistoryFromHistorySet': ['TypicalHistoryFromHistorySet'],
+    'dataObjectLabelFilter': ['dataObjectLabelFilter'],
+}
+# reverse map of class name -> submodule defining it, for attribute resolution
+_attributeToSubmodule = {attr: submod
+                         for submod, attrs in _submoduleAttributes.items()
+                         for attr in attrs}
+# classes with "Q" variants defined in the same submodules, guarded by the optional
+# prequisite library PySide; the variant is preferred when it is available, decided
+# only when the type is first requested so the probe costs nothing at import
+_preferredVariants = types.MappingProxyType({'TopologicalDecomposition': 'QTopologicalDecomposition',
+                                             'DataMining': 'QDataMining'})
+# additional registered names some post-processors have historically answered to,
+# as {extra name: class name}; both names resolve to the same class
+_additionalNames = types.MappingProxyType({'External': 'ExternalPostProcessor'})
 
-### PostProcessorFunctions (orig: InterfacedPostProcessor)
-from .HistorySetDelay import HistorySetDelay
-from .HS2PS import HS2PS
-from .HStoPSOperator import HStoPSOperator
-from .HistorySetSampling import HistorySetSampling
-from .HistorySetSnapShot import HistorySetSnapShot
-from .HistorySetSync import HistorySetSync
-from .TypicalHistoryFromHistorySet import TypicalHistoryFromHistorySet
-from .dataObjectLabelFilter import dataObjectLabelFilter
-## These utilize the optional prequisite library PySide, so don't error if they
-## do not import appropriately.
-try:
-  from .TopologicalDecomposition import QTopologicalDecomposition
-  from .DataMining import QDataMining
-  renaming = {'QTopologicalDecomposition': 'TopologicalDecomposition',
-              'QDataMining': 'DataMining'}
-except ImportError:
-  renaming = {}
+__all__ = ['factory', 'PostProcessorInterface'] + list(_attributeToSubmodule)
 
-factory = EntityFactory('PostProcessorInterface', needsRunInfo=True)
-factory.registerAllSubtypes(PostProcessorInterface, alias=renaming)
+def _buildFactory():
+  """
+    Builds the factory and registers the manifest types with it. Called once, on
+    first access of the module-level "factory" attribute, so that even the
+    EntityFactory machinery stays off the cold import path of this module.
+    @ In, None
+    @ Out, _buildFactory, EntityFactory, the registered factory
+  """
+  from ...EntityFactoryBase import EntityFactory
+  newFactory = EntityFactory('PostProcessorInterface', needsRunInfo=True)
+  newFactory.registerMany(itertools.chain(
+      ((attr, f'{__package__}.{submod}', attr, _preferredVariants.get(attr))
+       for submod, attrs in _submoduleAttributes.items()
+       for attr in attrs),
+      ((name, f'{__package__}.{_attributeToSubmodule[className]}', className, None)
+       for name, className in _additionalNames.items())))
+  return newFactory
 
-factory.registerType('External', ExternalPostProcessor)
+def __getattr__(name):
+  """
+    Resolves the lazily-loaded attributes of this module (PEP 562): the factory
+    itself, the interface class, and the post-processor classes listed in
+    _submoduleAttributes.
+    @ In, name, str, name of the requested attribute
+    @ Out, __getattr__, object, the resolved attribute
+  """
+  if name == 'factory':
+    globals()['factory'] = _buildFactory()
+    return globals()['factory']
+  if name == 'PostProcessorInterface':
+    from .PostProcessorInterface import PostProcessorInterface
+    globals()['PostProcessorInterface'] = PostProcessorInterface
+    return PostProcessorInterface
+  submod = _attributeToSubmodule.get(name)
+  if submod is not None:
+    module = importlib.import_module('.' + submod, __package__)
+    globals()[name] = getattr(module, name)
+    return globals()[name]
+  raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+def __dir__():
+  """
+    Lists the attributes of this module, including the lazily-loaded ones.
+    @ In, None
+    @ Out, __dir__, list, available attribute names
+  """
+  return sorted(set(globals()) | set(__all__))
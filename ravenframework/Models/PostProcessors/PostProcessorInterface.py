@@ -34,6 +34,20 @@ class PostProcessorInterface(BaseInterface):
   """
     Base class for other postprocessor interfaces (i.e., BasicStatistics, ETImporter).
   """
+  _registeredSubclasses = {} # all subclasses, recorded at class-definition time, as {name: class}
+
+  def __init_subclass__(cls, registerAs=None, **kwargs):
+    """
+      Records each new subclass in the interface-wide registry when the module
+      defining it is executed, so registration happens exactly once, where the
+      class is defined, with no reflective scans needed afterwards.
+      @ In, registerAs, str, optional, name to record the subclass under (defaults to the class name)
+      @ In, kwargs, dict, additional keyword arguments for base implementations
+      @ Out, None
+    """
+    super().__init_subclass__(**kwargs)
+    PostProcessorInterface._registeredSubclasses[registerAs or cls.__name__] = cls
+
   @classmethod
   def getInputSpecification(cls):
     """
@@ -22,4 +22,17 @@
 from .PostProcessorInterface import PostProcessorInterface
 from .PostProcessorReadyInterface import PostProcessorReadyInterface
 from .ValidationBase import ValidationBase
-from .Factory import factory
+
+def __getattr__(name):
+  """
+    Resolves the lazily-loaded attributes of this package (PEP 562). The factory
+    re-export is deferred so that importing the package does not trigger the
+    import of every post-processor submodule (see Factory.py).
+    @ In, name, str, name of the requested attribute
+    @ Out, __getattr__, object, the resolved attribute
+  """
+  if name == 'factory':
+    from .Factory import factory
+    globals()['factory'] = factory
+    return factory
+  raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
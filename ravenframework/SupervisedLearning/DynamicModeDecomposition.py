@@ -166,7 +166,7 @@ class DMD(SupervisedLearning):
       @ In, state, dict, it contains all the information needed by the ROM to be initialized
       @ Out, None
     """
-    self.__dict__.update(state)
+    super().__setstate__(state)
     self.KDTreeFinder = spatial.KDTree(self.featureVals)
 
   def _localNormalizeData(self,values,names,feat):
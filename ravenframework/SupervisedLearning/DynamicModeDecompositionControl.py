@@ -29,6 +29,7 @@ from sklearn import neighbors
 from ..utils import mathUtils
 from ..utils import InputData, InputTypes
 from .DynamicModeDecomposition import DMD
+from .SupervisedLearning import SupervisedLearning
 #Internal Modules End--------------------------------------------------------------------------------
 
 class DMDC(DMD):
@@ -186,7 +187,8 @@ class DMDC(DMD):
       @ In, state, dict, it contains all the information needed by the ROM to be initialized
       @ Out, None
     """
-    self.__dict__.update(state)
+    # bypass DMD's restore (no KDTree here) but keep the base-class restore shims
+    SupervisedLearning.__setstate__(self, state)
 
   def __trainLocal__(self,featureVals,targetVals):
     """
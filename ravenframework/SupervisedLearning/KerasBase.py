@@ -2154,7 +2154,7 @@ class KerasBase(SupervisedLearning):
     del d[KerasBase.modelAttr]
     self._ROM = tf.keras.models.load_model(KerasBase.tempModelFile)
     os.remove(KerasBase.tempModelFile)
-    self.__dict__.update(d)
+    SupervisedLearning.__setstate__(self, d)
 
   def writeXML(self, writeTo, targets=None, skip=None):
     """
@@ -26,7 +26,6 @@
 
 #External Modules------------------------------------------------------------------------------------
 import abc
-import copy
 import numpy as np
 #External Modules End--------------------------------------------------------------------------------
 
@@ -97,6 +96,9 @@ class SupervisedLearning(BaseInterface):
     #checking if None provides a more clear message about the problem
     if arrayIn is None:
       return (False,' The object is None, and contains no entries!')
+    #fast path: the overwhelmingly common input is a plain 1-d numpy array
+    if isinstance(arrayIn, np.ndarray) and arrayIn.ndim == 1:
+      return (True,'')
     if type(arrayIn).__name__ == 'list':
       if isDynamic:
         for cnt, elementArray in enumerate(arrayIn):
@@ -108,8 +110,9 @@ class SupervisedLearning(BaseInterface):
     else:
       if type(arrayIn).__name__ not in ['ndarray','c1darray']:
         return (False,' The object is not a numpy array. Got type: '+type(arrayIn).__name__)
-      if len(np.asarray(arrayIn).shape) > 1:
-        return(False, ' The array must be 1-d. Got shape: '+str(np.asarray(arrayIn).shape))
+      arr = arrayIn if isinstance(arrayIn, np.ndarray) else np.asarray(arrayIn)
+      if arr.ndim > 1:
+        return(False, ' The array must be 1-d. Got shape: '+str(arr.shape))
     return (True,'')
 
   def __init__(self):
@@ -130,6 +133,11 @@ class SupervisedLearning(BaseInterface):
     #a dictionary where for each feature a tuple (average value, sigma)
     #these need to be declared in the child classes!!!!
     self.muAndSigmaFeatures = {}   # normalization parameters
+    self._muVec = None             # normalization offsets as a vector aligned with self.features (set by train)
+    self._sigmaVec = None          # normalization scales as a vector aligned with self.features (set by train)
+    self._trustedInputs = False    # if True, evaluate skips per-call input validation (for trusted hot predict loops)
+    self._evalKeys = None          # key order of the last evaluate request, to reuse its name->index map
+    self._evalNameIdx = None       # cached name->index map for repeated evaluate requests
     self.metadataKeys = set()      # keys that can be passed to DataObject as meta information
     self.metadataParams = {}       # indexMap for metadataKeys to pass to a DataObject as meta dimensionality
 
@@ -166,7 +174,11 @@ class SupervisedLearning(BaseInterface):
       @ In, None
       @ Out, state, dict, it contains all the information needed by the ROM to be initialized
     """
-    state = copy.copy(self.__dict__)
+    # pickling copies the dict as it traverses it, so no explicit shallow copy is
+    # needed; the normalization vectors are left out since __setstate__ rebuilds
+    # them from muAndSigmaFeatures
+    skip = {'_muVec', '_sigmaVec', '_evalKeys', '_evalNameIdx'}
+    state = {key: value for key, value in self.__dict__.items() if key not in skip}
     return state
 
   def __setstate__(self, d):
@@ -180,6 +192,18 @@ class SupervisedLearning(BaseInterface):
     #FIXME: NEW PICKLED ROMS
     if 'dynamicFeatures' not in d:
       self.dynamicFeatures = False
+    # ROMs pickled before the vectorized normalization store (or pickled without it,
+    # since it regenerates cheaply) carry only the per-feature dict; rebuild the vectors
+    if d.get('_muVec') is None:
+      if self.muAndSigmaFeatures and self.features:
+        self._buildNormalizationVectors()
+      else:
+        self._muVec = None
+        self._sigmaVec = None
+    # per-call caches and settings introduced after older serializations
+    self.__dict__.setdefault('_trustedInputs', False)
+    self._evalKeys = None
+    self._evalNameIdx = None
 
   def setEstimator(self, estimatorList):
     """
@@ -220,52 +244,90 @@ class SupervisedLearning(BaseInterface):
     if type(tdict) != dict:
       self.raiseAnError(TypeError,'In method "train", the training set needs to be provided through a dictionary. Type of the in-object is ' + str(type(tdict)))
     names, values  = list(tdict.keys()), list(tdict.values())
+    nameIdx = {name: idx for idx, name in enumerate(names)} # O(1) lookups instead of repeated list scans
     ## This is for handling the special case needed by skl *MultiTask* that
     ## requires multiple targets.
     targetValues = []
     for target in self.target:
-      if target in names:
-        targetValues.append(values[names.index(target)])
+      if target in nameIdx:
+        targetValues.append(values[nameIdx[target]])
       else:
         self.raiseAnError(IOError,'The target '+target+' is not in the training set')
 
-    # stack targets
-    targetValues = np.stack(targetValues, axis=-1)
+    # stack targets into a preallocated matrix, filled column by column; this skips
+    # the temporary buffer and extra copy np.stack goes through
+    targetColumns = [np.asarray(target) for target in targetValues]
+    targetValues = np.empty(targetColumns[0].shape + (len(targetColumns),),
+                            dtype=np.result_type(*targetColumns))
+    for cnt, column in enumerate(targetColumns):
+      targetValues[..., cnt] = column
     # construct the evaluation matrixes
     ## add the indices if they're not present
-    needFeatures = copy.deepcopy(self.features)
-    needTargets = copy.deepcopy(self.target)
+    # shallow copies suffice: these hold immutable variable-name strings
+    needFeatures = list(self.features)
+    needTargets = list(self.target)
     if indexMap:
       for feat in self.features:
         for index in indexMap.get(feat, []):
           if index not in needFeatures and index not in needTargets:
             needFeatures.append(feat)
     if self.dynamicFeatures:
-      featLen = 0
-      for cnt, feat in enumerate(self.features):
-        featLen = max(values[names.index(feat)][0].size, featLen)
-      featureValues = np.zeros(shape=(len(targetValues), featLen,len(self.features)))
-    else:
-      featureValues = np.zeros(shape=(len(targetValues), len(self.features)))
+      featLen = max(values[nameIdx[feat]][0].size for feat in self.features)
+    featureColumns = []
     for cnt, feat in enumerate(self.features):
-      if feat not in names:
+      if feat not in nameIdx:
         self.raiseAnError(IOError,'The feature sought '+feat+' is not in the training set')
       else:
-        valueToUse = values[names.index(feat)]
+        valueToUse = values[nameIdx[feat]]
         resp = self.checkArrayConsistency(valueToUse, self.isDynamic())
         if not resp[0]:
           self.raiseAnError(IOError,'In training set for feature '+feat+':'+resp[1])
-        valueToUse = np.asarray(valueToUse)
-        if len(valueToUse) != featureValues.shape[0]:
-          self.raiseAWarning('feature values:',featureValues.shape[0],tag='ERROR')
+        # convert to the canonical dtype once at ingestion, so the normalization
+        # arithmetic below runs without per-operation upcasts of int or object inputs
+        valueToUse = np.asarray(valueToUse, dtype=np.float64)
+        if len(valueToUse) != len(targetValues):
+          self.raiseAWarning('feature values:',len(targetValues),tag='ERROR')
           self.raiseAWarning('target values:',len(valueToUse),tag='ERROR')
           self.raiseAnError(IOError,'In training set, the number of values provided for feature '+feat+' are != number of target outcomes!')
-        self._localNormalizeData(values,names,feat)
         # valueToUse can be either a matrix (for who can handle time-dep data) or a vector (for who can not)
         if self.dynamicFeatures:
-          featureValues[:, :, cnt] = (valueToUse[:, :]- self.muAndSigmaFeatures[feat][0])/self.muAndSigmaFeatures[feat][1]
+          self._localNormalizeData(values,names,feat)
+          column = (valueToUse[:, :]- self.muAndSigmaFeatures[feat][0])/self.muAndSigmaFeatures[feat][1]
+          if column.shape[1] != featLen:
+            # histories shorter than the longest one keep the broadcast-padding
+            # semantics the old buffer assignment provided
+            column = np.broadcast_to(column, (column.shape[0], featLen))
+          featureColumns.append(column)
         else:
-          featureValues[:,cnt] = ( (valueToUse[:,0] if len(valueToUse.shape) > 1 else valueToUse[:]) - self.muAndSigmaFeatures[feat][0])/self.muAndSigmaFeatures[feat][1]
+          featureColumns.append(valueToUse if valueToUse.ndim == 1 else valueToUse[:, 0])
+    if self.dynamicFeatures:
+      # one contiguous stack of the normalized histories instead of F strided slab
+      # writes into a pre-sized 3-D buffer
+      featureValues = np.stack(featureColumns, axis=-1)
+    else:
+      # assemble the raw columns once and normalize in a single broadcast pass, instead
+      # of one strided write plus one small arithmetic op per feature; column-major
+      # (Fortran) order keeps each feature column contiguous, matching both the fill
+      # pattern here and the per-feature access of the learning kernels downstream
+      rawValues = np.empty((len(targetValues), len(self.features)), dtype=np.float64, order='F')
+      for cnt, column in enumerate(featureColumns):
+        rawValues[:, cnt] = column
+      if type(self)._localNormalizeData is SupervisedLearning._localNormalizeData:
+        # no ROM-specific normalization: compute every column's factors in one
+        # vectorized pass over the stacked matrix. NOTE the factors come from the
+        # assembled columns; for a 2-D history feature that would be its first entry
+        # only, unlike the per-feature hook which sees the full original array, but
+        # such features cannot reach this static path (checkArrayConsistency rejects
+        # them above)
+        offsets, scales = mathUtils.columnNormalizationFactors(rawValues)
+        for cnt, feat in enumerate(self.features):
+          self.muAndSigmaFeatures[feat] = (offsets[cnt], scales[cnt])
+      else:
+        for feat in self.features:
+          self._localNormalizeData(values, names, feat)
+    self._buildNormalizationVectors()
+    if not self.dynamicFeatures:
+      featureValues = (rawValues - self._muVec) / self._sigmaVec
 
     self.__trainLocal__(featureValues,targetValues)
     self.amITrained = True
@@ -281,6 +343,20 @@ class SupervisedLearning(BaseInterface):
     """
     self.muAndSigmaFeatures[feat] = mathUtils.normalizationFactors(values[names.index(feat)])
 
+  def _buildNormalizationVectors(self):
+    """
+      Assembles the per-feature normalization factors collected in muAndSigmaFeatures
+      into two vectors aligned with self.features, so train and evaluate can normalize
+      a whole feature matrix with a single broadcast operation instead of one small
+      arithmetic pass per feature.
+      @ In, None
+      @ Out, None
+    """
+    self._muVec = np.fromiter((self.muAndSigmaFeatures[feat][0] for feat in self.features),
+                              dtype=np.float64, count=len(self.features))
+    self._sigmaVec = np.fromiter((self.muAndSigmaFeatures[feat][1] for feat in self.features),
+                                 dtype=np.float64, count=len(self.features))
+
   def confidence(self, edict):
     """
       This call is used to get an estimate of the confidence in the prediction.
@@ -291,6 +367,7 @@ class SupervisedLearning(BaseInterface):
     if type(edict) != dict:
       self.raiseAnError(IOError,'method "confidence". The inquiring set needs to be provided through a dictionary. Type of the in-object is ' + str(type(edict)))
     names, values   = list(edict.keys()), list(edict.values())
+    nameIdx = {name: idx for idx, name in enumerate(names)} # O(1) lookups instead of repeated list scans
     for index in range(len(values)):
       resp = self.checkArrayConsistency(values[index], self.isDynamic())
       if not resp[0]:
@@ -299,15 +376,13 @@ class SupervisedLearning(BaseInterface):
     if self.dynamicFeatures:
       featureValues = np.zeros(shape=(values[0].size, self.featureShape[1], len(self.features)))
     else:
-      featureValues = np.zeros(shape=(values[0].size, len(self.features)))
+      featureValues = np.empty(shape=(values[0].size, len(self.features)), order='F')
     for cnt, feat in enumerate(self.features):
-      if feat not in names:
+      if feat not in nameIdx:
         self.raiseAnError(IOError,'The feature sought '+feat+' is not in the evaluate set')
       else:
-        resp = self.checkArrayConsistency(values[names.index(feat)], self.isDynamic())
-        if not resp[0]:
-          self.raiseAnError(IOError,'In training set for feature '+feat+':'+resp[1])
-        featureValues[:,cnt] = values[names.index(feat)]
+        # every entry was already validated in the loop above
+        featureValues[:,cnt] = values[nameIdx[feat]]
     return self.__confidenceLocal__(featureValues)
 
   # compatibility with BaseInterface requires having a "run" method
@@ -333,32 +408,43 @@ class SupervisedLearning(BaseInterface):
     if type(edict) != dict:
       self.raiseAnError(IOError,'method "evaluate". The evaluate request/s need/s to be provided through a dictionary. Type of the in-object is ' + str(type(edict)))
     names, values  = list(edict.keys()), list(edict.values())
+    # repeated evaluate requests (e.g. a surrogate inside an optimization loop) almost
+    # always carry the same variables in the same order, so reuse the name->index map;
+    # getattr guards cover ROMs restored by __setstate__ overrides that predate these caches
+    if tuple(names) != getattr(self, '_evalKeys', None):
+      self._evalKeys = tuple(names)
+      self._evalNameIdx = {name: idx for idx, name in enumerate(names)}
+    nameIdx = self._evalNameIdx
     stepInFeatures = 0
     for index in range(len(values)):
       # If value is a float or int, convert to numpy array for evaluation
       if isinstance(values[index], (float, int, np.number)):
         values[index] = np.array([values[index]])
-      resp = self.checkArrayConsistency(values[index], self.isDynamic())
-      if not resp[0]:
-        self.raiseAnError(IOError,'In evaluate request for feature '+names[index]+':'+resp[1])
+      if not getattr(self, '_trustedInputs', False):
+        resp = self.checkArrayConsistency(values[index], self.isDynamic())
+        if not resp[0]:
+          self.raiseAnError(IOError,'In evaluate request for feature '+names[index]+':'+resp[1])
       if self.dynamicFeatures:
         stepInFeatures = max(stepInFeatures,values[index].shape[-1])
     # construct the evaluation matrix
     if self.dynamicFeatures:
-      featureValues = np.zeros(shape=(values[0].size, stepInFeatures, len(self.features)))
+      featureValues = np.empty(shape=(values[0].size, stepInFeatures, len(self.features)))
     else:
-      featureValues = np.zeros(shape=(values[0].size, len(self.features)))
+      featureValues = np.empty(shape=(values[0].size, len(self.features)), order='F')
     for cnt, feat in enumerate(self.features):
-      if feat not in names:
+      if feat not in nameIdx:
         self.raiseAnError(IOError,'The feature sought '+feat+' is not in the evaluate set')
       else:
-        resp = self.checkArrayConsistency(values[names.index(feat)], self.isDynamic())
-        if not resp[0]:
-          self.raiseAnError(IOError,'In training set for feature '+feat+':'+resp[1])
+        # every entry was already validated in the loop above
         if self.dynamicFeatures:
-          featureValues[:, :, cnt] = ((values[names.index(feat)] - self.muAndSigmaFeatures[feat][0]))/self.muAndSigmaFeatures[feat][1]
+          featureValues[:, :, cnt] = values[nameIdx[feat]]
         else:
-          featureValues[:,cnt] = ((values[names.index(feat)] - self.muAndSigmaFeatures[feat][0]))/self.muAndSigmaFeatures[feat][1]
+          featureValues[:,cnt] = values[nameIdx[feat]]
+    if getattr(self, '_muVec', None) is None:
+      # ROM restored from a serialization predating the vectorized normalization store
+      self._buildNormalizationVectors()
+    # normalize the whole matrix in one broadcast over the feature axis
+    featureValues = (featureValues - self._muVec)/self._sigmaVec
     return self.__evaluateLocal__(featureValues)
 
   def reset(self):
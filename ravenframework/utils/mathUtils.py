@@ -267,6 +267,37 @@ def normalizationFactors(values, mode='z'):
 
   return (offset, scale)
 
+def columnNormalizationFactors(matrix, mode='z'):
+  """
+    Vectorized version of normalizationFactors for a whole sample matrix: computes
+    the factors for every column in single numpy reductions instead of one call
+    per column. The per-column edge cases match normalizationFactors (constant
+    column -> scale of max absolute value, all-zero column -> scale of 1).
+    @ In, matrix, np.ndarray, (samples, variables) data for which to obtain normalization factors
+    @ In, mode, str, the mode of normalization to perform (see normalizationFactors)
+    @ Out, (offsets,scales), 2-tuple of np.ndarray, per-column offsets and scaling
+      factors, i.e. (x - offsets)/scales
+  """
+  if mode is None:
+    mode = 'none'
+
+  if mode == 'z':
+    offsets = np.average(matrix, axis=0)
+    scales = np.std(matrix, axis=0)
+  elif mode == 'scale':
+    offsets = np.min(matrix, axis=0)
+    scales = np.max(matrix, axis=0) - offsets
+  else:
+    offsets = np.zeros(matrix.shape[1])
+    scales = np.ones(matrix.shape[1])
+
+  degenerate = scales == 0
+  if degenerate.any():
+    scales = np.where(degenerate, np.max(np.absolute(matrix), axis=0), scales)
+    scales[scales == 0] = 1.0
+
+  return (offsets, scales)
+
 #
 # I need to convert it in multi-dimensional
 # Not a priority yet. Andrea
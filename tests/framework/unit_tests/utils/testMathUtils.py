@@ -307,6 +307,22 @@ checkArray('0-1 scaling sequentialList: ', factors, (0,4))
 factors = mathUtils.normalizationFactors(sequentialList, mode='none')
 checkArray('No scaling sequentialList: ', factors,(0,1))
 
+### check "columnNormalizationFactors" (vectorized, column-wise normalizationFactors)
+colMatrix = np.array([zeroList, fourList, sequentialList]).T
+
+offsets, scales = mathUtils.columnNormalizationFactors(colMatrix, mode='z')
+checkArray('Z-score column offsets: ', offsets, (0, 4, 2))
+checkArray('Z-score column scales: ', scales, (1, 4, 1.41421356237))
+offsets, scales = mathUtils.columnNormalizationFactors(colMatrix, mode='scale')
+checkArray('0-1 scaling column offsets: ', offsets, (0, 4, 0))
+checkArray('0-1 scaling column scales: ', scales, (1, 4, 4))
+offsets, scales = mathUtils.columnNormalizationFactors(colMatrix, mode='none')
+checkArray('No scaling column offsets: ', offsets, (0, 0, 0))
+checkArray('No scaling column scales: ', scales, (1, 1, 1))
+offsets, scales = mathUtils.columnNormalizationFactors(colMatrix, mode=None)
+checkArray('None mode column offsets: ', offsets, (0, 0, 0))
+checkArray('None mode column scales: ', scales, (1, 1, 1))
+
 #check hyperrectangle diagonal on several dimensions
 ## 2d
 sideLengths = [3,4]